@@ -1,61 +1,187 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_cache import CachedSession
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime, date
-import json
+import orjson
+import os
 import re
 import time # Import time module
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 # Add urllib.parse import here for urljoin
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse, urlsplit
+from dateutil.parser import parse as _dateutil_parse
+from grants_io import save_grants
+from patterns import (COMMON_TLDS, DESC_ORG_PATTERNS, ORG_SUFFIX_RE, TITLE_ORG_PATTERNS, TLD_SUFFIX_RE,
+                      URL_PREFIX_RE, WWW_PREFIX_RE, clean_text, find_org)
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# --- Precompiled patterns (compiled once at import, not per call/article) ---
+_ORDINAL_RE = re.compile(r'(\d+)(th|st|nd|rd)\b')
+_ZWS_RE = re.compile(r'[\u200B-\u200D\uFEFF]')
+_WS_RE = re.compile(r'\s+')
+
+# Amount building blocks (non-capturing groups for internal use)
+_CURRENCY_SYMBOLS_NC = r'(?:[$€£])'
+_CURRENCY_CODES_NC = r'(?:USD|EUR|GBP)'
+_NUMBER_PATTERN_NC = r'(?:\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)'
+# Capturing variants for extraction
+_CURRENCY_CAPTURE = rf'({_CURRENCY_SYMBOLS_NC}|{_CURRENCY_CODES_NC})' # Captures the specific symbol/code
+_NUMBER_CAPTURE = rf'({_NUMBER_PATTERN_NC})' # Captures the number string
+_MULTIPLIER_CAPTURE = r'(\s*(?:k|thousand|million)\b)'
+
+# 1. Mangled Range (e.g., 025 - 203) - Assume thousands, no currency info usually
+# Groups: (num1), (num2)
+_MANGLED_RANGE_RE = re.compile(r'\b(0?\d{1,3})\s*-\s*(\d{1,3})\b')
+# 2. Standard Range (e.g., $1,000 - $5,000 or 10k - 20k euros)
+# Groups: (cur1)?, (num1), (mult1)?, (cur2)?, (num2), (mult2)?
+_STANDARD_RANGE_RE = re.compile(
+    rf'(?:{_CURRENCY_CAPTURE})?\s*{_NUMBER_CAPTURE}(?:\s*{_MULTIPLIER_CAPTURE})?\s*(?:-|to)\s*(?:{_CURRENCY_CAPTURE})?\s*{_NUMBER_CAPTURE}(?:\s*{_MULTIPLIER_CAPTURE})?',
+    re.IGNORECASE
+)
+# 3. Up To / Maximum (e.g., up to $10,000, maximum of 5 million EUR)
+# Groups: (cur1)?, (num), (mult)?, (cur2)?
+_UPTO_RE = re.compile(
+    rf'(?:up to|maximum of|upto)\s+(?:{_CURRENCY_CAPTURE})?\s*{_NUMBER_CAPTURE}(?:{_MULTIPLIER_CAPTURE})?\s*(?:{_CURRENCY_CAPTURE})?',
+    re.IGNORECASE
+)
+# 4. Single Amount - requires keywords like 'grant of', 'prize of', 'amount:'
+# Groups: (cur1)?, (num), (mult)?, (cur2)?
+_STRICT_SINGLE_RE = re.compile(
+    rf'(?:grants? of|prize of|award of|funding of|amount:)\s*{_CURRENCY_CAPTURE}?\s*{_NUMBER_CAPTURE}\s*{_MULTIPLIER_CAPTURE}?\s*{_CURRENCY_CAPTURE}?',
+    re.IGNORECASE
+)
+# Currency Code specific. Groups: (code), (num), (mult)?
+_CODE_SINGLE_RE = re.compile(
+    rf'({_CURRENCY_CODES_NC})\s*{_NUMBER_CAPTURE}\s*{_MULTIPLIER_CAPTURE}?',
+    re.IGNORECASE
+)
+# Currency Symbol specific. Groups: (symbol), (num), (mult)?
+_SYMBOL_SINGLE_RE = re.compile(
+    rf'({_CURRENCY_SYMBOLS_NC})\s*{_NUMBER_CAPTURE}\s*{_MULTIPLIER_CAPTURE}?',
+    re.IGNORECASE
+)
+# Single-amount patterns in priority order (earlier patterns win ties on value)
+_SINGLE_AMOUNT_PATTERNS = (_STRICT_SINGLE_RE, _CODE_SINGLE_RE, _SYMBOL_SINGLE_RE)
+_NUM_CLEAN_TABLE = str.maketrans('', '', '$€£,') # Deletes currency symbols and thousands separators
+_MULTIPLIERS = {'k': 1000, 'thousand': 1000, 'million': 1000000}
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+
+# Organization extraction (title/description patterns are shared via patterns.py)
+_URL_ORG_RES = [re.compile(p) for p in (
+    r"https?://(?:www\.)?([a-zA-Z0-9-]+)\.",
+    r"https?://(?:www\.)?[a-zA-Z0-9-]+\.([a-zA-Z0-9-]+)\."
+)]
+# Fallback patterns for grants still missing an organization after the scrape
+_FALLBACK_ORG_RES = [re.compile(p) for p in (
+    r"([\w\s&\-',.]+?)(?:'s|s'|s) (?:Grant|Award|Prize|Program|Programme|Initiative|Fund)",
+    r"(?:by|from|sponsored by|offered by|from the|by the) ([\w\s&\-',.]+)"
+)]
+_FOUNDATION_RE = re.compile(r"([\w\s&\-',.]+Foundation)")
+# Title keyword -> generic organization, first match wins (UNESCO ahead of its "UN" substring);
+# None means take the full "... Foundation" name from the title
+_TITLE_ORG_KEYWORDS = {
+    "UNESCO": "UNESCO",
+    "UN": "United Nations",
+    "United Nations": "United Nations",
+    "WHO": "World Health Organization",
+    "EU": "European Union",
+    "European Union": "European Union",
+    "Foundation": None,
+    "Award": "Award Program",
+    "Prize": "Prize Program",
+    "Scholarship": "Scholarship Program",
+    "Fellowship": "Fellowship Program",
+}
 
+# Deadline detection
+_DEADLINE_RE = re.compile(r'Deadline\s*:\s*([\w\s,-]+?\d{4}|\d{1,2}[-/][A-Za-z]{3,}[-/]\d{2,4})', re.IGNORECASE)
+_DEADLINE_TAG_RE = re.compile(r'Deadline', re.IGNORECASE)
+_DEADLINE_LABEL_RE = re.compile(r'Deadline\s*:\s*', re.IGNORECASE)
+
+# Eligibility section detection (keyword at start of text or after punctuation/space).
+# Each keyword set is one alternation, so a single scan finds the earliest heading;
+# longer keywords come first so "Eligibility Criteria" wins over "Eligibility".
+# Searched on the original text with IGNORECASE so match offsets index it directly
+# (str.lower() can change the length, e.g. 'İ' lowers to two code points).
+_ELIGIBILITY_KEYWORDS = ("Eligibility Criteria", "Who can apply?", "Eligible Applicants", "Eligibility")
+_END_MARKERS = ("Funding Information", "How to Apply", "Application Process", "Award Information",
+                "Prize Information", "Focus Areas", "Thematic Areas", "Objectives", "Benefits")
+_ELIGIBILITY_KEYWORD_RE = re.compile(
+    rf'(?:^|[\s.:;])\s*({"|".join(re.escape(k.lower()) for k in _ELIGIBILITY_KEYWORDS)})\b', re.IGNORECASE
+)
+_END_MARKER_RE = re.compile(
+    rf'(?:^|[\s.:;])\s*({"|".join(re.escape(m.lower()) for m in _END_MARKERS)})\b', re.IGNORECASE
+)
+_LEADING_PUNCT_RE = re.compile(r'^[:\s]+')
+
+# HTML parsing: only build the subtrees we actually read
+def _is_post_class(css_class):
+    """Matches WordPress 'post-<id>' class tokens; BeautifulSoup calls this once per token"""
+    return bool(css_class) and css_class.startswith('post-') and css_class[5:].isdigit()
+
+
+# Strainers see the raw class attribute ("entry-content clearfix"), not split tokens
+_ARTICLE_STRAINER = SoupStrainer('article')
+_CONTENT_STRAINER = SoupStrainer('div', class_=re.compile(r'(?:^|\s)entry-content(?:\s|$)'))
+
+
+_DATE_FORMATS = (
+    "%d-%b-%y", "%d-%b-%Y", "%d %b %Y", "%d %B %Y",
+    "%d/%m/%y", "%d/%m/%Y", "%m/%d/%y", "%m/%d/%Y",
+    "%Y-%m-%d"
+)
+
+
+# Deadline strings repeat heavily across grants and pages, so parses are memoised on the raw input
+@lru_cache(maxsize=8192)
 def parse_date(date_str):
-    import locale
-    formats = [
-        "%d-%b-%y", "%d-%b-%Y", "%d %b %Y", "%d %B %Y",
-        "%d/%m/%y", "%d/%m/%Y", "%m/%d/%y", "%m/%d/%Y",
-        "%Y-%m-%d", "%d %B %Y", "%d %b %Y"
-    ]
-    
     # Normalize input
-    cleaned = re.sub(r'(\d+)(th|st|nd|rd)\b', r'\1', date_str.strip())
-    cleaned = re.sub(r'[\u200B-\u200D\uFEFF]', '', cleaned)
-    cleaned = re.sub(r'\s+', ' ', cleaned)
-    
+    cleaned = _ORDINAL_RE.sub(r'\1', date_str.strip())
+    cleaned = _ZWS_RE.sub('', cleaned)
+    cleaned = _WS_RE.sub(' ', cleaned)
+
     # Try standard formats first
-    for fmt in formats:
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(cleaned, fmt)
         except ValueError:
             continue
-    
-    # Try locale-specific parsing
-    original_locale = locale.getlocale(locale.LC_TIME)
-    try:
-        for lang in ['en_US', 'fr_FR', 'es_ES']:
-            try:
-                locale.setlocale(locale.LC_TIME, f'{lang}.UTF-8')
-                dt = datetime.strptime(cleaned, "%d %b %Y")
-                locale.setlocale(locale.LC_TIME, original_locale)
-                return dt
-            except:
-                continue
-    finally:
-        locale.setlocale(locale.LC_TIME, original_locale)
-    
-    # Final fallback to dateutil
+
+    # Fallback to dateutil (handles "December 31, 2025", "Sept 30, 2025", ...)
     try:
-        from dateutil.parser import parse
-        return parse(cleaned)
+        return _dateutil_parse(cleaned)
     except Exception as e:
-        logging.error(f"Date parsing failed for '{date_str}': {str(e)}")
-    
-    logging.warning(f"All date parsing attempts failed for: {date_str}")
+        logger.error("Date parsing failed for '%s': %s", date_str, e)
+
+    logger.warning("All date parsing attempts failed for: %s", date_str)
     return None
 
 
+def clean_and_convert(num_str, multiplier_str=None):
+    if num_str is None: return None
+    try:
+        # Remove currency symbols and commas for calculation
+        cleaned_num = num_str.translate(_NUM_CLEAN_TABLE).strip()
+        # Captured multipliers may carry leading whitespace (e.g. " million")
+        multiplier = _MULTIPLIERS.get(multiplier_str.strip().lower(), 1) if multiplier_str else 1
+        if cleaned_num.isdecimal():
+            return int(cleaned_num) * multiplier # Whole numbers skip the float round-trip
+        return int(float(cleaned_num) * multiplier)
+    except (ValueError, TypeError):
+        logger.warning("Could not convert '%s' with multiplier '%s' to number.", num_str, multiplier_str)
+        return None
+
+
 # Option E: Return tuple (amount_int, currency_str) - Corrected Group Capturing
+# Memoised: the result is an immutable tuple and boilerplate descriptions recur across listings
+@lru_cache(maxsize=1024)
 def extract_amount(text):
     """
     Extracts a grant amount and currency from text.
@@ -63,187 +189,216 @@ def extract_amount(text):
     Handles currency symbols, codes (USD/EUR/GBP), commas, and multipliers.
     Returns a tuple (max_amount_int, currency_string) or (None, None).
     """
-    # Define base patterns with non-capturing groups for internal use
-    currency_symbols_nc = r'(?:[$€£])'
-    currency_codes_nc = r'(?:USD|EUR|GBP)'
-    currency_pattern_nc = rf'(?:{currency_symbols_nc}|{currency_codes_nc})'
-    number_pattern_nc = r'(?:\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)'
-    multiplier_pattern_nc = r'(?:\s*(?:k|thousand|million)\b)'
-
-    # Define patterns with specific capturing groups for extraction
-    currency_capture = rf'({currency_symbols_nc}|{currency_codes_nc})' # Captures the specific symbol/code
-    number_capture = rf'({number_pattern_nc})' # Captures the number string
-    multiplier_capture = r'(\s*(?:k|thousand|million)\b)' # Fixed: Added parentheses around the entire pattern
-
-    # --- Helper Function ---
-    def clean_and_convert(num_str, multiplier_str=None):
-        if num_str is None: return None
-        try:
-            # Remove currency symbols and commas for calculation
-            cleaned_num = re.sub(rf'{currency_symbols_nc}|,', '', num_str).strip()
-            value = float(cleaned_num)
-            multiplier = 1
-            if multiplier_str:
-                multi_lower = multiplier_str.lower()
-                if multi_lower == 'k' or multi_lower == 'thousand': multiplier = 1000
-                elif multi_lower == 'million': multiplier = 1000000
-            return int(value * multiplier)
-        except (ValueError, TypeError):
-            logging.warning(f"Could not convert '{num_str}' with multiplier '{multiplier_str}' to number.")
-            return None
-
-    # --- Regex Patterns (with corrected capturing groups) ---
-    # 1. Mangled Range (e.g., 025 - 203) - Assume thousands, no currency info usually
-    # Groups: (num1), (num2)
-    mangled_range_pattern = re.compile(r'\b(0?\d{1,3})\s*-\s*(\d{1,3})\b')
-
-    # 2. Standard Range (e.g., $1,000 - $5,000 or 10k - 20k euros)
-    # Groups: (cur1)?, (num1), (mult1)?, (cur2)?, (num2), (mult2)?, (cur3)?
-    # Corrected: Removed '?' after number_capture groups as numbers are required in a range.
-    # Fixed regex pattern with proper grouping and escaping
-    try:
-        standard_range_pattern = re.compile(
-            rf'(?:{currency_capture})?\s*{number_capture}(?:\s*{multiplier_capture})?\s*(?:-|to)\s*(?:{currency_capture})?\s*{number_capture}(?:\s*{multiplier_capture})?',
-            re.IGNORECASE
-        )
-    except re.error as e:
-        logging.error(f"Regex compilation error: {str(e)}")
+    # Every amount pattern needs at least one digit - skip the regex scan when there is none
+    if not text or not any(digit in text for digit in '0123456789'):
         return None, None
 
-    # 3. Up To / Maximum (e.g., up to $10,000, maximum of 5 million EUR)
-    # Groups: (cur1)?, (num), (mult)?, (cur2)?
-    upto_pattern = re.compile(
-        rf'(?:up to|maximum of|upto)\s+(?:{currency_capture})?\s*{number_capture}(?:{multiplier_capture})?\s*(?:{currency_capture})?',
-        re.IGNORECASE
-    )
-
-    # 4. Single Amount (Prefers explicit keywords or currency symbols/codes)
-    # Stricter: Requires keywords like 'grant of', 'prize of', 'amount:', 'USD', etc.
-    # Groups: (cur1)?, (num), (mult)?, (cur2)?
-    strict_single_pattern = re.compile(
-        rf'(?:grants? of|prize of|award of|funding of|amount:)\s*{currency_capture}?\s*{number_capture}\s*{multiplier_capture}?\s*{currency_capture}?',
-        re.IGNORECASE
-    )
-    # Currency Code specific
-    # Groups: (code), (num), (mult)?
-    code_single_pattern = re.compile(
-        rf'({currency_codes_nc})\s*{number_capture}\s*{multiplier_capture}?', # Capture code, num, mult
-        re.IGNORECASE
-    )
-    # Currency Symbol specific
-    # Groups: (symbol), (num), (mult)?
-    symbol_single_pattern = re.compile(
-        rf'({currency_symbols_nc})\s*{number_capture}\s*{multiplier_capture}?', # Capture symbol, num, mult
-        re.IGNORECASE
-    )
-
     # --- Search Logic ---
-    found_amount = None
-    found_currency = None
-
-    # 1. Check Mangled Range (Assume thousands, no currency)
-    mangled_match = mangled_range_pattern.search(text)
+    # 1. Mangled Range (Assume thousands, no currency)
+    mangled_match = _MANGLED_RANGE_RE.search(text)
     if mangled_match:
-        num1_str, num2_str = mangled_match.groups() # Expects 2 groups
+        num1_str, num2_str = mangled_match.groups()
         val1 = clean_and_convert(num1_str, 'thousand')
         val2 = clean_and_convert(num2_str, 'thousand')
         if val1 is not None and val2 is not None:
             found_amount = max(val1, val2)
             found_currency = "$" # Default to $ for mangled ranges
-            logging.info(f"Found mangled range amount: {mangled_match.group(0)} -> {found_amount} (Currency: {found_currency})")
+            logger.debug("Found mangled range amount: %s -> %s (Currency: %s)", mangled_match.group(0), found_amount, found_currency)
             return f"{found_currency}{found_amount}", None
-        else:
-            logging.warning(f"Found mangled range '{mangled_match.group(0)}' but failed conversion.")
+        logger.warning("Found mangled range '%s' but failed conversion.", mangled_match.group(0))
 
-    # 2. Check Standard Range
-    range_match = standard_range_pattern.search(text)
+    # 2. Standard Range
+    range_match = _STANDARD_RANGE_RE.search(text)
     if range_match:
-        # Expects 7 groups: cur1, num1, mult1, cur2, num2, mult2, cur3
-        cur1, num1_str, mult1, cur2, num2_str, mult2, cur3 = range_match.groups()
+        cur1, num1_str, mult1, cur2, num2_str, mult2 = range_match.groups()
         mult2 = mult2 or mult1 # Use first multiplier if second is missing
         val1 = clean_and_convert(num1_str, mult1)
         val2 = clean_and_convert(num2_str, mult2)
         if val1 is not None and val2 is not None:
             found_amount = max(val1, val2)
-            # Determine currency: prioritize currency next to max value, then other currency, then None
+            # Determine currency: prioritize currency next to max value, then other currency, then $
             max_val_cur = cur2 if val2 >= val1 else cur1
-            # Safely get currency values with fallbacks
-            found_currency = next((c for c in [max_val_cur, cur3, cur1, cur2] if c), "$")
-            logging.info(f"Found standard range amount: {range_match.group(0)} -> {found_amount} (Currency: {found_currency})")
+            found_currency = max_val_cur or cur1 or cur2 or "$"
+            logger.debug("Found standard range amount: %s -> %s (Currency: %s)", range_match.group(0), found_amount, found_currency)
             return f"{found_currency}{found_amount}", None
-        else:
-            logging.warning(f"Found standard range '{range_match.group(0)}' but failed conversion.")
+        logger.warning("Found standard range '%s' but failed conversion.", range_match.group(0))
 
-    # 3. Check "Up to X" / "Maximum of X"
-    upto_match = upto_pattern.search(text)
+    # 3. "Up to X" / "Maximum of X"
+    upto_match = _UPTO_RE.search(text)
     if upto_match:
-        # Expects 4 groups: cur1, num, mult, cur2
         cur1, num_str, mult_str, cur2 = upto_match.groups()
-        try:
-            val = clean_and_convert(num_str, mult_str)
-        except Exception as e:
-            logging.warning(f"Amount conversion failed: {str(e)}")
-            val = None
+        val = clean_and_convert(num_str, mult_str)
         if val is not None:
             found_amount = val
             found_currency = cur1 or cur2 or "$" # Prioritize currency before number, default to $
-            logging.info(f"Found 'up to/maximum' amount: {upto_match.group(0)} -> {found_amount} (Currency: {found_currency})")
+            logger.debug("Found 'up to/maximum' amount: %s -> %s (Currency: %s)", upto_match.group(0), found_amount, found_currency)
             return f"{found_currency}{found_amount}", None
 
-    # 4. Check Single Amounts (Strict keywords, codes, then symbols)
+    # 4. Single Amounts (strict keywords, codes, then symbols)
     potential_matches = [] # Store tuples of (value, currency, original_match_string)
-    patterns_to_check = [
-        (strict_single_pattern, 4), # cur1, num, mult, cur2
-        (code_single_pattern, 3),   # code, num, mult
-        (symbol_single_pattern, 3)  # symbol, num, mult
-    ]
-
-    for pattern, expected_groups in patterns_to_check:
+    for pattern in _SINGLE_AMOUNT_PATTERNS:
         for match in pattern.finditer(text):
-            groups = match.groups()
-            if len(groups) != expected_groups:
-                logging.error(f"Regex pattern {pattern.pattern} returned {len(groups)} groups, expected {expected_groups}. Match: {match.group(0)}")
-                continue # Skip this match if group count is wrong
-
-            num_str, mult_str, currency = None, None, None
-
-            try:
-                if pattern == strict_single_pattern:
-                    cur1, num_str, mult_str, cur2 = groups
-                    currency = cur1 or cur2
-                elif pattern == code_single_pattern:
-                    currency, num_str, mult_str = groups
-                elif pattern == symbol_single_pattern:
-                    currency, num_str, mult_str = groups
-            except ValueError as e:
-                 logging.error(f"Error unpacking groups for pattern {pattern.pattern} on match '{match.group(0)}': {e}")
-                 continue
-
-
+            if pattern is _STRICT_SINGLE_RE:
+                cur1, num_str, mult_str, cur2 = match.groups()
+                currency = cur1 or cur2
+            else:
+                currency, num_str, mult_str = match.groups()
             val = clean_and_convert(num_str, mult_str)
             if val is not None:
-                 is_year = (1990 <= val <= 2050 and mult_str is None and '.' not in num_str)
-                 if not is_year:
-                     potential_matches.append((val, currency, match.group(0)))
-                     logging.debug(f"Potential single amount: {match.group(0)} -> {val} (Currency: {currency})")
+                is_year = (1990 <= val <= 2050 and mult_str is None and '.' not in num_str)
+                if not is_year:
+                    potential_matches.append((val, currency, match.group(0)))
+                    logger.debug("Potential single amount: %s -> %s (Currency: %s)", match.group(0), val, currency)
 
     if potential_matches:
-        # Sort by value descending, return the largest amount and its currency
-        potential_matches.sort(key=lambda x: x[0], reverse=True)
-        found_amount, found_currency, match_str = potential_matches[0]
-        logging.info(f"Found single amount(s), selected max: {match_str} -> {found_amount} (Currency: {found_currency})")
+        # Return the largest amount (first one found on ties, i.e. by pattern priority) and its currency
+        found_amount, found_currency, match_str = max(potential_matches, key=lambda x: x[0])
+        logger.debug("Found single amount(s), selected max: %s -> %s (Currency: %s)", match_str, found_amount, found_currency)
         return found_amount, found_currency
 
     # Fallback: No reliable amount found
-    logging.info(f"No clear amount pattern found in text: '{text[:100]}...'")
+    logger.debug("No clear amount pattern found in text: '%s...'", text[:100])
     return None, None
 
 
+def remove_deadline(text, deadline_str):
+    """Removes every 'Deadline: <deadline_str>' occurrence (case-insensitive) without compiling a regex from page text"""
+    target = deadline_str.lower()
+    pieces, last = [], 0
+    for label in _DEADLINE_LABEL_RE.finditer(text):
+        end = label.end() + len(deadline_str)
+        if label.start() >= last and text[label.end():end].lower() == target:
+            pieces.append(text[last:label.start()])
+            last = end
+    if not pieces:
+        return text
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
+def clean_amount_value(amount_str):
+    """Clean and standardize amount values"""
+    if not amount_str:
+        return None
+
+    # Handle Unicode characters
+    if isinstance(amount_str, str):
+        amount_str = amount_str.replace('\u00a3', '£')
+
+    # Add missing currency symbol if it's just a number
+    if isinstance(amount_str, (int, float)):
+        return f"${amount_str:,}"
+
+    # If it's a string with just digits, add $ symbol
+    if isinstance(amount_str, str) and amount_str.isdigit():
+        return f"${int(amount_str):,}"
+
+    # If it already has a currency symbol, format it properly
+    if isinstance(amount_str, str) and amount_str.startswith(('$', '£', '€')):
+        currency = amount_str[0]
+        try:
+            value = float(_NON_NUMERIC_RE.sub('', amount_str))
+            return f"{currency}{value:,.0f}"
+        except:
+            return amount_str
+            
+    return amount_str
+
+
+def finalize_grant(grant):
+    """Backfills required fields and normalises text/amount values; called once per grant before it is appended"""
+    # Ensure all required fields exist
+    for field in ['deadline', 'title', 'applicationUrl', 'organization', 'description', 'amount', 'status', 'eligibility', 'category']:
+        if field not in grant or grant[field] is None:
+            if field == 'amount':
+                grant[field] = None
+            elif field == 'organization' and (field not in grant or grant[field] == "Organization Not Found"):
+                grant[field] = "Unknown Organization"
+            else:
+                grant[field] = ""
+
+    # Clean text fields
+    for field in ['title', 'description', 'eligibility']:
+        if grant[field]:
+            grant[field] = clean_text(grant[field])
+
+    # Clean amount field
+    if grant['amount']:
+        grant['amount'] = clean_amount_value(grant['amount'])
+    return grant
+
+
+@lru_cache(maxsize=4096)
+def _host_org(domain):
+    """Organization name from a URL domain (longest non-TLD label), cached since grants share a few hosts"""
+    domain_parts = [p for p in domain.split('.') if p.lower() not in COMMON_TLDS]
+    if domain_parts:
+        return clean_text(max(domain_parts, key=len).replace('-', ' ').title())
+    return None
+
+
+def extract_organization(article, grant):
+    """Enhanced organization name extraction from multiple sources"""
+    # Priority 1: Check if organization is mentioned in title pattern
+    title = grant.get('title', '')
+    org = find_org(TITLE_ORG_PATTERNS, title)
+    if org:
+        return org
+
+    # Priority 2: Extract from URL domain
+    url = grant.get('applicationUrl', '')
+    if url:
+        try:
+            org = _host_org(urlsplit(url).hostname or '')
+            if org:
+                return org
+        except ValueError as e:
+            logger.debug("Error extracting org from URL: %s", e)
+
+    # Priority 3: Extract from description first sentence
+    desc = grant.get('description', '')
+    if desc:
+        first_sentence = desc.split('.')[0] if '.' in desc else desc
+        org = find_org(DESC_ORG_PATTERNS, first_sentence)
+        if org:
+            return org
+
+    # Priority 4: Check article metadata (if available)
+    if article:
+        org_tag = article.find('span', class_='author') or \
+         article.find('span', class_='organization') or \
+         article.find('div', class_='org-name')
+        if org_tag and org_tag.text.strip():
+            return clean_text(org_tag.text.strip())
+
+    # Priority 5: Extract from application URL directly
+    if url:
+        for pattern in _URL_ORG_RES:
+            match = pattern.search(url)
+            if match and match.group(1) and match.group(1).lower() not in COMMON_TLDS:
+                return clean_text(match.group(1).replace('-', ' ').title())
+
+    # Fallback: Try to extract organization from the application URL hostname
+    if url:
+        try:
+            hostname = urlparse(url).netloc
+            if hostname:
+                # Remove www. and common TLDs
+                org_name = WWW_PREFIX_RE.sub('', hostname)
+                org_name = TLD_SUFFIX_RE.sub('', org_name)
+                if org_name:
+                    return clean_text(org_name.split('.')[0].replace('-', ' ').title())
+        except Exception as e:
+            logger.debug("Error parsing URL: %s", e)
+
+    # Fallback: Return a more specific "Unknown" rather than "Not Found"
+    return "Unknown Organization"
+
+
 # Change the output path to use grants.json in the current directory
 # Change from absolute Windows path to relative path
 base_url = "https://www2.fundsforngos.org/tag/funding-opportunities-and-resources-in-kenya/page/{}/"
 deadline_cutoff = date(2025, 4, 2)
-logging.info(f"CONFIRMED CUTOFF: {deadline_cutoff.strftime('%d-%b-%Y')}")
+logger.info("CONFIRMED CUTOFF: %s", deadline_cutoff.strftime('%d-%b-%Y'))
 output_path = 'grants.json'  # Changed to relative path
 
 # Remove this line that's overriding the output_path
@@ -251,256 +406,124 @@ output_path = 'grants.json'  # Changed to relative path
 
 # --- Load existing grants ---
 existing_grants = []
-existing_grant_urls = set()
+existing_grant_urls = frozenset()
 try:
-    # Remove the makedirs call since we're using a file in the current directory
+    # Make sure the output directory exists (dirname is '' for a bare filename)
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
     if os.path.exists(output_path):
-        with open(output_path, 'r', encoding='utf-8') as f:
-            existing_grants = json.load(f)
-            if isinstance(existing_grants, list):
-                for grant in existing_grants:
-                    if isinstance(grant, dict) and 'applicationUrl' in grant:
-                        existing_grant_urls.add(grant['applicationUrl'])
-                logging.info(f"Loaded {len(existing_grants)} existing grants from {output_path}")
-            else:
-                logging.warning(f"Existing file {output_path} does not contain a valid JSON list. Starting fresh.")
-                existing_grants = []
+        with open(output_path, 'rb') as f:
+            existing_grants = orjson.loads(f.read())
+        if isinstance(existing_grants, list):
+            existing_grant_urls = frozenset(grant['applicationUrl'] for grant in existing_grants
+                                            if isinstance(grant, dict) and 'applicationUrl' in grant)
+            logger.info("Loaded %s existing grants from %s", len(existing_grants), output_path)
+        else:
+            logger.warning("Existing file %s does not contain a valid JSON list. Starting fresh.", output_path)
+            existing_grants = []
     else:
-        logging.info(f"Initializing new output file {output_path}")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump([], f)
+        logger.info("Initializing new output file %s", output_path)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps([]))
 except Exception as e:
-    logging.error(f"Error loading existing grants: {str(e)}")
+    logger.error("Error loading existing grants: %s", e)
     existing_grants = []
 
 # Initialize grants list with existing data
 grants = existing_grants
 processed_urls = set() # Keep track of URLs processed in *this* run to avoid duplicate work
+new_urls = set() # Application URLs of grants appended in this run; existing_grant_urls stays frozen
 
 headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
 }
 
+# --- HTTP: one pooled session shared by all fetches, detail pages fetched concurrently ---
+MAX_WORKERS = 8
+MIN_REQUEST_INTERVAL = 0.5 # Seconds between request starts across all workers (polite crawl rate)
+HTTP_CACHE_NAME = '.scraper_cache' # SQLite file (.scraper_cache.sqlite) reused across runs
+
+# Cached responses are revalidated with ETag/Last-Modified once expired, so re-runs
+# mostly get 304 Not Modified instead of full page transfers
+session = CachedSession(HTTP_CACHE_NAME, backend='sqlite', expire_after=3600, cache_control=True)
+session.headers.update(headers)
+# Transient failures are retried with short exponential backoff; once retries are exhausted the
+# last response is returned so raise_for_status() still reports it. Retry-After is ignored: the
+# adapter's retries sleep inside a pool worker and bypass throttled_get's spacing, so a large
+# header value must not be able to stall a worker
+_retry = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504],
+               raise_on_status=False, respect_retry_after_header=False)
+session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_retry))
+detail_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+def throttled_get(url):
+    """GET url via the shared session, spacing request starts MIN_REQUEST_INTERVAL apart"""
+    global _next_request_at
+    with _rate_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + MIN_REQUEST_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+    return session.get(url, timeout=30)
+
+def fetch_detail_content(url):
+    """Fetches a grant detail page and returns its parsed entry-content div (or None); runs on detail_pool"""
+    detail_resp = throttled_get(url)
+    detail_resp.raise_for_status()
+    detail_soup = BeautifulSoup(detail_resp.content, 'lxml', parse_only=_CONTENT_STRAINER)
+    return detail_soup.find('div', class_='entry-content')
+
 for page in range(1, 11):
-    logging.info(f"Processing page {page}...")
+    logger.info("Processing page %s...", page)
     page_url = base_url.format(page)
     try:
-        response = requests.get(page_url, headers=headers, timeout=30)
+        response = throttled_get(page_url)
         response.raise_for_status()
-        time.sleep(2)
 
-        soup = BeautifulSoup(response.content, 'html.parser')
-        articles = soup.find_all('article', class_=re.compile(r'post-\d+'))
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=_ARTICLE_STRAINER)
+        articles = soup.find_all('article', class_=_is_post_class)
 
         if not articles:
-            logging.info(f"No articles found on page {page}, stopping.")
+            logger.info("No articles found on page %s, stopping.", page)
             break
 
         page_has_valid_grants = False
 
+        # Collect the listing entries first so their detail pages can be fetched concurrently
+        listing = []
         for article in articles:
+            title_tag = article.find('h2', class_='entry-title')
+            link_tag = title_tag.find('a') if title_tag else None
+
+            if not title_tag or not link_tag or not link_tag.has_attr('href'):
+                logger.warning("  Skipping article - missing title/URL")
+                continue
+            if link_tag['href'] in processed_urls:
+                continue
+            listing.append((article, link_tag.get_text(strip=True), link_tag['href']))
+
+        # Fetch and parse run on the pool; results are consumed in listing order so output order is unchanged
+        detail_futures = [detail_pool.submit(fetch_detail_content, detail_url) for _, _, detail_url in listing]
+
+        for (article, title, detail_url), detail_future in zip(listing, detail_futures):
             # Initialize grant dictionary with defaults
-            grant = {'deadline': None, 'title': None, 'applicationUrl': None, 'organization': None,
+            grant = {'deadline': None, 'title': clean_text(title), 'applicationUrl': detail_url, 'organization': None,
                      'description': None, 'amount': None, 'status': 'active', 
                      'eligibility': 'See official guidelines', 'category': 'General'}
             try:
-                title_tag = article.find('h2', class_='entry-title')
-                link_tag = title_tag.find('a') if title_tag else None
-
-                if not title_tag or not link_tag or not link_tag.has_attr('href'):
-                    logging.warning(f"  Skipping article - missing title/URL")
-                    continue
-
-                # First, let's add the clean_text function that's missing
-                def clean_text(text):
-                    """Clean and normalize text content"""
-                    if not text:
-                        return text
-                        
-                    # Replace common Unicode characters
-                    text = text.replace('\u2019', "'")
-                    text = text.replace('\u2018', "'")
-                    text = text.replace('\u201c', '"')
-                    text = text.replace('\u201d', '"')
-                    text = text.replace('\u2013', '-')
-                    text = text.replace('\u2014', '-')
-                    text = text.replace('\u00a0', ' ')
-                    
-                    # Remove excessive whitespace
-                    text = re.sub(r'\s+', ' ', text).strip()
-                    
-                    return text
-                
-                # Add a function to clean amount values
-                def clean_amount_value(amount_str):
-                    """Clean and standardize amount values"""
-                    if not amount_str:
-                        return None
-                        
-                    # Handle Unicode characters
-                    if isinstance(amount_str, str):
-                        amount_str = amount_str.replace('\u00a3', '£')
-                    
-                    # Add missing currency symbol if it's just a number
-                    if isinstance(amount_str, (int, float)):
-                        return f"${amount_str:,}"
-                        
-                    # If it's a string with just digits, add $ symbol
-                    if isinstance(amount_str, str) and amount_str.isdigit():
-                        return f"${int(amount_str):,}"
-                        
-                    # If it already has a currency symbol, format it properly
-                    if isinstance(amount_str, str) and amount_str.startswith(('$', '£', '€')):
-                        currency = amount_str[0]
-                        try:
-                            value = float(re.sub(r'[^\d.]', '', amount_str))
-                            return f"{currency}{value:,.0f}"
-                        except:
-                            return amount_str
-                            
-                    return amount_str
-                
-                # Define the extract_organization function properly
-                def extract_organization(article, grant):
-                    """Enhanced organization name extraction from multiple sources"""
-                    # Priority 1: Check if organization is mentioned in title pattern
-                    title = grant.get('title', '')
-                    org_patterns = [
-                        r"(?:by|from|at|for)\s+([A-Z][A-Za-z\s&'-]+?(?=\s+(Grant|Award|Program|Prize|Fellowship)))",
-                        r"(?:by|from|at|for)\s+([A-Z][A-Za-z\s&'-]+?(?=\.|$))",
-                        r"(?:presented by|sponsored by|supported by)\s+([A-Z][A-Za-z\s&'-]+)"
-                    ]
-                    
-                    for pattern in org_patterns:
-                        match = re.search(pattern, title, re.IGNORECASE)
-                        if match:
-                            org = next((g for g in match.groups() if g), None)
-                            if org:
-                                return clean_text(org.strip("'s").strip())
-                    
-                    # Priority 2: Extract from URL domain
-                    url = grant.get('applicationUrl', '')
-                    if url:
-                        try:
-                            domain = url.split('/')[2] if len(url.split('/')) > 2 else ''
-                            domain_parts = [p for p in domain.split('.') 
-                                          if p.lower() not in {'com','org','net','gov','edu','co','ac','uk','www'}]
-                            if domain_parts:
-                                org = max(domain_parts, key=len)
-                                return clean_text(org.replace('-', ' ').title())
-                        except Exception as e:
-                            logging.debug(f"Error extracting org from URL: {e}")
-                    
-                    # Priority 3: Extract from description first sentence
-                    desc = grant.get('description', '')
-                    if desc:
-                        first_sentence = desc.split('.')[0] if '.' in desc else desc
-                        org_patterns = [
-                            r"(?:The|A|An)\s+([A-Z][A-Za-z\s&'-]+?(?=\s+(is|has|announces|offers)))",
-                            r"([A-Z][A-Za-z\s&'-]+?(?=\s+(Grant|Award|Program|Initiative)))",
-                            r"(?:funded by|sponsored by)\s+([A-Z][A-Za-z\s&'-]+)"
-                        ]
-                        for pattern in org_patterns:
-                            match = re.search(pattern, first_sentence, re.IGNORECASE)
-                            if match:
-                                org = next((g for g in match.groups() if g), None)
-                                if org:
-                                    return clean_text(org.strip("'s").strip())
-                    
-                    # Priority 4: Check article metadata (if available)
-                    if article:
-                        org_tag = article.find('span', class_='author') or \
-                         article.find('span', class_='organization') or \
-                         article.find('div', class_='org-name')
-                        if org_tag and org_tag.text.strip():
-                            return clean_text(org_tag.text.strip())
-                    
-                    # Priority 5: Extract from application URL directly
-                    if url:
-                        url_org_patterns = [
-                            r"https?://(?:www\.)?([a-zA-Z0-9-]+)\.",
-                            r"https?://(?:www\.)?[a-zA-Z0-9-]+\.([a-zA-Z0-9-]+)\."
-                        ]
-                        for pattern in url_org_patterns:
-                            match = re.search(pattern, url)
-                            if match and match.group(1) and match.group(1).lower() not in {'com','org','net','gov','edu','co','ac','uk','www'}:
-                                return clean_text(match.group(1).replace('-', ' ').title())
-                    
-                    # Fallback: Try to extract organization from the application URL hostname
-                    if url:
-                        try:
-                            from urllib.parse import urlparse
-                            hostname = urlparse(url).netloc
-                            if hostname:
-                                # Remove www. and common TLDs
-                                org_name = re.sub(r'^www\.', '', hostname)
-                                org_name = re.sub(r'\.(com|org|net|gov|edu|co|ac|uk)$', '', org_name)
-                                if org_name:
-                                    return clean_text(org_name.split('.')[0].replace('-', ' ').title())
-                        except Exception as e:
-                            logging.debug(f"Error parsing URL: {e}")
-                    
-                    # Fallback: Return a more specific "Unknown" rather than "Not Found"
-                    return "Unknown Organization"
-                
-                # Make sure to add this code where you process each grant
-                # This should be in your main scraping loop where you process each article
-                grant['organization'] = extract_organization(article, grant)
-                
-                # Clean organization name if needed
-                if grant['organization'] and grant['organization'] not in ["Unknown Organization", "Organization Not Found"]:
-                    grant['organization'] = re.sub(r"(https?://|www\.)", "", grant['organization'], flags=re.IGNORECASE)
-                    grant['organization'] = re.sub(r"\b(Trust|Foundation|Fund|Org(a?nization)?|Programme?)\b", "", grant['organization'], flags=re.IGNORECASE)
-                    grant['organization'] = grant['organization'].strip(" -_./")
-                    if len(grant['organization']) < 3:  # If too short after cleaning
-                        grant['organization'] = "Unknown Organization"
-                
-                # Apply this function to extract amount from description if not already set
-                if not grant['amount'] or grant['amount'] == 'null':
-                    extracted_amount = extract_amount_from_text(full_description_text)
-                    if extracted_amount:
-                        grant['amount'] = extracted_amount
-                
-                # --- Fix text encoding issues ---
-                # Add this before saving the grants
-                def clean_text(text):
-                    """Clean and normalize text content"""
-                    if not text:
-                        return text
-                        
-                    # Replace common Unicode characters
-                    text = text.replace('\u2019', "'")
-                    text = text.replace('\u2018', "'")
-                    text = text.replace('\u201c', '"')
-                    text = text.replace('\u201d', '"')
-                    text = text.replace('\u2013', '-')
-                    text = text.replace('\u2014', '-')
-                    text = text.replace('\u00a0', ' ')
-                    
-                    # Remove excessive whitespace
-                    text = re.sub(r'\s+', ' ', text).strip()
-                    
-                    return text
-                
-                # Apply text cleaning to all text fields
-                for field in ['title', 'description', 'eligibility']:
-                    if field in grant and grant[field]:
-                        grant[field] = clean_text(grant[field])
-
-                logging.info(f"  Fetching details for: {grant['title'][:50]}...")
-                detail_resp = requests.get(grant['applicationUrl'], headers=headers, timeout=30)
-                detail_resp.raise_for_status()
-                time.sleep(2)
-                detail_soup = BeautifulSoup(detail_resp.content, 'html.parser')
-
-                content_div = detail_soup.find('div', class_='entry-content')
+                logger.info("  Processing details for: %s...", grant['title'][:50])
+                content_div = detail_future.result()
                 full_description_text = ""
                 cleaned_description = "Description not found."
                 deadline_str_extracted = None
+                deadline_date = None # Parsed deadline, kept so it is never re-parsed from the formatted string
                 external_application_url = grant['applicationUrl'] # Default
 
                 if content_div:
-                    full_description_text = ' '.join(content_div.stripped_strings)
+                    full_description_text = content_div.get_text(' ', strip=True)
                     cleaned_description = full_description_text
 
                     # --- Find the external application link ---
@@ -517,51 +540,32 @@ for page in range(1, 11):
                         link_tag = info_para.find('a', href=True)
                         if link_tag:
                             external_application_url = urljoin(grant['applicationUrl'], link_tag['href'])
-                            logging.info(f"  Found external application URL: {external_application_url}")
-                        else: logging.warning(f"  Found 'For more info' paragraph but no link inside.")
-                    else: logging.warning(f"  Could not find 'For more info' paragraph.")
+                            logger.info("  Found external application URL: %s", external_application_url)
+                        else: logger.warning("  Found 'For more info' paragraph but no link inside.")
+                    else: logger.warning("  Could not find 'For more info' paragraph.")
                     # --- End of external link finding ---
 
                     # --- START: Extract Eligibility ---
                     eligibility_summary = "See official guidelines" # Default
-                    eligibility_keywords = ["Eligibility Criteria", "Who can apply?", "Eligible Applicants", "Eligibility"]
                     eligibility_start_index = -1
                     found_keyword = None
-                    keyword_search_text = full_description_text.lower()
-
-                    for keyword in eligibility_keywords:
-                        try:
-                            # Use regex to find keyword at start of line or after punctuation/space
-                            # This helps ensure it's likely a heading
-                            match = re.search(rf'(?:^|[\s.:;])\s*({re.escape(keyword)})\b', full_description_text, re.IGNORECASE | re.MULTILINE)
-                            if match:
-                                eligibility_start_index = match.start(1) # Start index of the keyword itself
-                                found_keyword = match.group(1) # Get the actual matched keyword casing
-                                logging.info(f"  Found potential eligibility keyword: '{found_keyword}' at index {eligibility_start_index}")
-                                break
-                        except Exception as e_regex:
-                            logging.error(f"Regex error searching for eligibility keyword '{keyword}': {e_regex}")
-                            continue
+
+                    # Earliest keyword at start of text or after punctuation/space - likely a heading
+                    match = _ELIGIBILITY_KEYWORD_RE.search(full_description_text)
+                    if match:
+                        eligibility_start_index = match.start(1) # Start index of the keyword itself
+                        found_keyword = full_description_text[match.start(1):match.end(1)] # Actual keyword casing
+                        logger.info("  Found potential eligibility keyword: '%s' at index %s", found_keyword, eligibility_start_index)
 
                     if eligibility_start_index != -1:
                         start_pos = eligibility_start_index + len(found_keyword)
-                        eligibility_text = full_description_text[start_pos:].strip()
-                        eligibility_text = re.sub(r'^[:\s]+', '', eligibility_text) # Clean leading punctuation
 
                         # Find end point (e.g., next common heading or max length)
-                        end_markers = ["Funding Information", "How to Apply", "Application Process", "Award Information", "Prize Information", "Focus Areas", "Thematic Areas", "Objectives", "Benefits"]
-                        end_pos = len(eligibility_text)
-                        for marker in end_markers:
-                            try:
-                                # Find marker, ensuring it's likely a heading
-                                marker_match = re.search(rf'(?:^|[\s.:;])\s*({re.escape(marker)})\b', eligibility_text, re.IGNORECASE | re.MULTILINE)
-                                if marker_match:
-                                    end_pos = min(end_pos, marker_match.start())
-                            except Exception as e_marker:
-                                logging.error(f"Regex error searching for end marker '{marker}': {e_marker}")
-                                continue
-
-                        eligibility_text_segment = eligibility_text[:end_pos].strip()
+                        marker_match = _END_MARKER_RE.search(full_description_text, start_pos)
+                        end_pos = marker_match.start() if marker_match else len(full_description_text)
+
+                        eligibility_text = full_description_text[start_pos:end_pos].strip()
+                        eligibility_text_segment = _LEADING_PUNCT_RE.sub('', eligibility_text).strip() # Clean leading punctuation
                         max_len = 300 # Max length for summary
                         if len(eligibility_text_segment) > max_len:
                             # Try to cut at a sentence boundary nicely
@@ -574,70 +578,76 @@ for page in range(1, 11):
                         elif len(eligibility_text_segment) > 5: # Require a bit more text to be considered valid
                             eligibility_summary = eligibility_text_segment
                         else:
-                            logging.warning(f"  Found eligibility keyword '{found_keyword}' but extracted text too short.")
+                            logger.warning("  Found eligibility keyword '%s' but extracted text too short.", found_keyword)
 
                         if eligibility_summary != "See official guidelines":
-                             logging.info(f"  Extracted eligibility summary: '{eligibility_summary[:50]}...'")
+                             logger.info("  Extracted eligibility summary: '%s...'", eligibility_summary[:50])
                              grant['eligibility'] = eligibility_summary
                         else:
-                             logging.warning(f"  Found eligibility keyword '{found_keyword}' but extracted summary was not suitable.")
+                             logger.warning("  Found eligibility keyword '%s' but extracted summary was not suitable.", found_keyword)
                     else:
-                        logging.warning(f"  Could not find eligibility section keywords.")
+                        logger.warning("  Could not find eligibility section keywords.")
                     # --- END: Extract Eligibility ---
 
 
                     # Attempt to extract deadline from detail page text FIRST
-                    deadline_match = re.search(r'Deadline\s*:\s*([\w\s,-]+?\d{4}|\d{1,2}[-/][A-Za-z]{3,}[-/]\d{2,4})', full_description_text, re.IGNORECASE)
+                    # Literal prefilter on the lowered copy; the regex only runs from the first hit.
+                    # Offsets line up unless lower() changed the length, then scan from the start
+                    deadline_match = None
+                    description_lower = full_description_text.lower()
+                    deadline_at = description_lower.find('deadline')
+                    if deadline_at != -1:
+                        if len(description_lower) != len(full_description_text):
+                            deadline_at = 0
+                        deadline_match = _DEADLINE_RE.search(full_description_text, deadline_at)
                     if deadline_match:
                         deadline_str_extracted = deadline_match.group(1).strip()
                         deadline_dt = parse_date(deadline_str_extracted)
                         if deadline_dt and deadline_dt.date() > deadline_cutoff:
+                            deadline_date = deadline_dt.date()
                             grant['deadline'] = deadline_dt.strftime("%d-%b-%y")
                             page_has_valid_grants = True
-                            # Remove the extracted deadline pattern from the description for cleanliness
-                            cleaned_description = re.sub(r'Deadline\s*:\s*' + re.escape(deadline_str_extracted), '', cleaned_description, flags=re.IGNORECASE).strip()
-                            logging.info(f"  Extracted deadline: {grant['deadline']}")
+                            # Remove the matched deadline span from the description for cleanliness
+                            cleaned_description = (cleaned_description[:deadline_match.start()] + cleaned_description[deadline_match.end():]).strip()
+                            logger.info("  Extracted deadline: %s", grant['deadline'])
                         elif deadline_dt:
-                             logging.info(f"  Skipping grant - deadline {deadline_str_extracted} is before cutoff {deadline_cutoff.strftime('%d-%b-%y')}")
+                             logger.info("  Skipping grant - deadline %s is before cutoff %s", deadline_str_extracted, deadline_cutoff.strftime('%d-%b-%y'))
                              processed_urls.add(grant['applicationUrl'])
                              continue
 
                 # Fallback deadline extraction from listing page
                 if grant['deadline'] is None:
-                    deadline_tag_list = article.find('strong', string=re.compile(r'Deadline', re.I))
+                    deadline_tag_list = article.find('strong', string=_DEADLINE_TAG_RE)
                     if deadline_tag_list:
-                         deadline_str_list = deadline_tag_list.find_parent('p').get_text(strip=True).split(':')[-1].strip()
+                         deadline_str_list = deadline_tag_list.find_parent('p').get_text(strip=True).rpartition(':')[2].strip()
                          deadline_dt_list = parse_date(deadline_str_list)
                          if deadline_dt_list and deadline_dt_list.date() > deadline_cutoff:
+                             deadline_date = deadline_dt_list.date()
                              grant['deadline'] = deadline_dt_list.strftime("%d-%b-%y")
                              page_has_valid_grants = True
                              deadline_str_extracted = deadline_str_list
                              # Attempt to remove this pattern too if found in description
-                             cleaned_description = re.sub(r'Deadline\s*:\s*' + re.escape(deadline_str_extracted), '', cleaned_description, flags=re.IGNORECASE).strip()
-                             logging.info(f"  Extracted deadline (fallback): {grant['deadline']}")
+                             cleaned_description = remove_deadline(cleaned_description, deadline_str_extracted).strip()
+                             logger.info("  Extracted deadline (fallback): %s", grant['deadline'])
                          elif deadline_dt_list:
-                             logging.info(f"  Skipping grant (listing page) - deadline {deadline_str_list} is before cutoff {deadline_cutoff.strftime('%d-%b-%y')}")
+                             logger.info("  Skipping grant (listing page) - deadline %s is before cutoff %s", deadline_str_list, deadline_cutoff.strftime('%d-%b-%y'))
                              processed_urls.add(grant['applicationUrl'])
                              continue
 
                 # Final deadline check
                 if grant['deadline'] is None:
-                    logging.warning(f"  Skipping grant - could not find valid deadline after {deadline_cutoff.strftime('%d-%b-%y')}")
+                    logger.warning("  Skipping grant - could not find valid deadline after %s", deadline_cutoff.strftime('%d-%b-%y'))
                     processed_urls.add(grant['applicationUrl'])
                     continue
 
                 # Validate required fields before saving
                 if not all([grant.get('title'), grant.get('applicationUrl'), grant.get('deadline')]):
-                    logging.warning(f"Skipping incomplete grant: {grant.get('title', 'Untitled')}")
+                    logger.warning("Skipping incomplete grant: %s", grant.get('title', 'Untitled'))
                     continue
                 
-                # Validate deadline format
-                try:
-                    if datetime.strptime(grant['deadline'], "%d-%b-%y").date() <= deadline_cutoff:
-                        logging.info(f"Skipping grant with deadline {grant['deadline']}")
-                        continue
-                except ValueError as e:
-                    logging.error(f"Invalid deadline format {grant['deadline']}: {str(e)}")
+                # Validate deadline against the cutoff using the parsed date
+                if deadline_date <= deadline_cutoff:
+                    logger.info("Skipping grant with deadline %s", grant['deadline'])
                     continue
 
                 # Set final description
@@ -652,92 +662,79 @@ for page in range(1, 11):
                 grant['applicationUrl'] = external_application_url
                 # grant['eligibility'] is set within the eligibility block above
 
+                # Organization comes from the external application URL/description, so extract it last
+                grant['organization'] = extract_organization(article, grant)
+
+                # Clean organization name if needed
+                if grant['organization'] and grant['organization'] not in ["Unknown Organization", "Organization Not Found"]:
+                    grant['organization'] = URL_PREFIX_RE.sub("", grant['organization'])
+                    grant['organization'] = ORG_SUFFIX_RE.sub("", grant['organization'])
+                    grant['organization'] = grant['organization'].strip(" -_./")
+                    if len(grant['organization']) < 3:  # If too short after cleaning
+                        grant['organization'] = "Unknown Organization"
+
                 # --- Check if grant already exists before appending ---
-                if grant['applicationUrl'] in existing_grant_urls:
-                    logging.info(f"  Grant '{grant['title'][:50]}...' already exists in {output_path}. Skipping append.")
+                if grant['applicationUrl'] in existing_grant_urls or grant['applicationUrl'] in new_urls:
+                    logger.info("  Grant '%s...' already exists in %s. Skipping append.", grant['title'][:50], output_path)
                 else:
                     # Fix the logging statement - 'currency' key no longer exists
-                    logging.info(f"  Successfully processed NEW grant: {grant['title']} (Amount: {grant['amount']})")
-                    grants.append(grant) # Append only if it's new
-                    existing_grant_urls.add(grant['applicationUrl']) # Add to existing URLs set immediately
+                    logger.info("  Successfully processed NEW grant: %s (Amount: %s)", grant['title'], grant['amount'])
+                    grants.append(finalize_grant(grant)) # Append only if it's new
+                    new_urls.add(grant['applicationUrl']) # Catch repeats later in this run
 
-                processed_urls.add(grant['applicationUrl']) # Add the original fundsforngos URL to avoid re-processing list items *in this run*
+                processed_urls.add(detail_url) # Add the original fundsforngos URL to avoid re-processing list items *in this run*
 
             except requests.exceptions.RequestException as req_e:
-                 logging.error(f"HTTP Error processing grant {grant.get('title', 'Unknown')}: {str(req_e)}")
-                 time.sleep(5)
+                 logger.error("HTTP Error processing grant %s: %s", grant.get('title', 'Unknown'), req_e)
                  continue
             except Exception as e:
-                logging.error(f"General error processing grant {grant.get('title', 'Unknown')}: {str(e)}", exc_info=True)
+                logger.error("General error processing grant %s: %s", grant.get('title', 'Unknown'), e, exc_info=True)
                 continue
 
         if not page_has_valid_grants:
-            logging.info(f"No grants with deadlines after {deadline_cutoff.strftime('%d-%b-%y')} found on page {page}. Stopping scrape.")
+            logger.info("No grants with deadlines after %s found on page %s. Stopping scrape.", deadline_cutoff.strftime('%d-%b-%y'), page)
             break
 
     except requests.exceptions.RequestException as req_e:
-        logging.error(f"HTTP Error processing page {page}: {str(req_e)}")
+        logger.error("HTTP Error processing page %s: %s", page, req_e)
         if isinstance(req_e, requests.exceptions.HTTPError) and req_e.response.status_code == 429:
-            logging.warning("Rate limit hit. Stopping script.")
+            logger.warning("Rate limit hit. Stopping script.")
             break
-        time.sleep(10)
         continue
     except Exception as e:
-        logging.error(f"General error processing page {page}: {str(e)}", exc_info=True)
+        logger.error("General error processing page %s: %s", page, e, exc_info=True)
         continue
 
+detail_pool.shutdown()
+
 # --- After loop ---
 # Calculate how many grants were newly added in this run
-new_grants_count = len(grants) - len(existing_grants)
+# (grants and existing_grants are the same list, so count the URLs appended instead)
+new_grants_count = len(new_urls)
 
 if new_grants_count > 0:
-    logging.info(f"Added {new_grants_count} new grants.")
+    logger.info("Added %s new grants.", new_grants_count)
     # Optionally log the first few new grants
     # logging.info("First few new grants added:")
     # new_grants_list = [g for g in grants if g['applicationUrl'] not in existing_grant_urls_before_run] # Need to capture state before run if needed
     # for i, g in enumerate(new_grants_list[:3]):
     #     logging.info(f"New Grant {i+1}: {json.dumps(g, indent=2)}")
 elif not grants: # No indent
-    logging.warning("No grants found in the file and no new grants were added.") # 4 spaces indent
+    logger.warning("No grants found in the file and no new grants were added.") # 4 spaces indent
 else: # No indent
-    logging.info("No new grants were added in this run.") # 4 spaces indent
+    logger.info("No new grants were added in this run.") # 4 spaces indent
 
 
 # At the end of the script, add more robust saving logic
-# Replace the existing save code with this:
+# (grants are normalised by finalize_grant() as they are appended, so no cleanup pass here)
 try:
-    # Make sure the directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    # Clean up any problematic entries before saving
-    for grant in grants:
-        # Ensure all required fields exist
-        for field in ['deadline', 'title', 'applicationUrl', 'organization', 'description', 'amount', 'status', 'eligibility', 'category']:
-            if field not in grant or grant[field] is None:
-                if field == 'amount':
-                    grant[field] = None
-                elif field == 'organization' and (field not in grant or grant[field] == "Organization Not Found"):
-                    grant[field] = "Unknown Organization"
-                else:
-                    grant[field] = ""
-        
-        # Clean text fields
-        for field in ['title', 'description', 'eligibility']:
-            if grant[field]:
-                grant[field] = clean_text(grant[field])
-        
-        # Clean amount field
-        if grant['amount']:
-            grant['amount'] = clean_amount_value(grant['amount'])
-    
-    # Save the file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(grants, f, indent=2, ensure_ascii=False)
+    # Save the file (temp file + atomic swap, see grants_io.save_grants)
+    save_grants(output_path, grants)
     
-    logging.info(f"Successfully saved {len(grants)} grants to {output_path}")
+    logger.info("Successfully saved %s grants to %s", len(grants), output_path)
     
 except Exception as e:
-    logging.error(f"Error saving grants to {output_path}: {str(e)}")
+    logger.error("Error saving grants to %s: %s", output_path, e)
 
 
 # --- Add this at the end of the script, before saving the grants ---
@@ -745,29 +742,24 @@ except Exception as e:
 
 # First, define a function to extract organization from URL
 def extract_org_from_url(url):
-    url_parts = url.split('/')
-    if len(url_parts) > 2:
-        domain = url_parts[2]
-        # Extract organization name from domain
-        domain_parts = domain.split('.')
-        if len(domain_parts) >= 2:
-            # Get the main part of the domain (e.g., "unesco" from "unesco.org")
-            org_name = domain_parts[-2]
-            # Clean up the organization name
-            if org_name.lower() not in ['com', 'org', 'net', 'gov', 'edu', 'co', 'ac']:
-                # Convert to title case and replace hyphens with spaces
-                org_name = org_name.replace('-', ' ').title()
-                return org_name
-            else:
-                # If it's a common TLD, use the part before it
-                if len(domain_parts) > 2:
-                    org_name = domain_parts[-3].replace('-', ' ').title()
-                    return org_name
-                else:
-                    return domain
-        else:
-            return domain
-    return None
+    try:
+        host = urlsplit(url).hostname
+    except ValueError as e: # e.g. "Invalid IPv6 URL" from a malformed href
+        logger.debug("Error parsing URL: %s", e)
+        return None
+    if not host:
+        return None
+    # Extract organization name from domain
+    domain_parts = host.split('.')
+    if len(domain_parts) < 2:
+        return host
+    # Get the main part of the domain (e.g., "unesco" from "unesco.org"),
+    # or the part before it when that is itself a common TLD (e.g. "example" from "example.co.uk")
+    if domain_parts[-2] not in COMMON_TLDS:
+        return domain_parts[-2].replace('-', ' ').title()
+    if len(domain_parts) > 2:
+        return domain_parts[-3].replace('-', ' ').title()
+    return host
 
 # Update all grants with "Organization Not Found"
 for grant in grants:
@@ -780,12 +772,8 @@ for grant in grants:
             # Try to extract from title
             if grant['title']:
                 # Look for organization patterns in the title
-                org_patterns = [
-                    r"([\w\s&\-',.]+?)(?:'s|s'|s) (?:Grant|Award|Prize|Program|Programme|Initiative|Fund)",
-                    r"(?:by|from|sponsored by|offered by|from the|by the) ([\w\s&\-',.]+)"
-                ]
-                for pattern in org_patterns:
-                    org_match = re.search(pattern, grant['title'])
+                for pattern in _FALLBACK_ORG_RES:
+                    org_match = pattern.search(grant['title'])
                     if org_match:
                         potential_org = org_match.group(1).strip()
                         # Validate it's not too long or too short
@@ -795,28 +783,13 @@ for grant in grants:
             
             # If still not found, use a generic name based on the grant type
             if grant['organization'] == "Organization Not Found":
-                if "UN" in grant['title'] or "United Nations" in grant['title']:
-                    grant['organization'] = "United Nations"
-                elif "UNESCO" in grant['title']:
-                    grant['organization'] = "UNESCO"
-                elif "WHO" in grant['title']:
-                    grant['organization'] = "World Health Organization"
-                elif "EU" in grant['title'] or "European Union" in grant['title']:
-                    grant['organization'] = "European Union"
-                elif "Foundation" in grant['title']:
-                    foundation_match = re.search(r"([\w\s&\-',.]+Foundation)", grant['title'])
-                    if foundation_match:
-                        grant['organization'] = foundation_match.group(1)
-                    else:
-                        grant['organization'] = "Foundation Grant"
-                elif "Award" in grant['title']:
-                    grant['organization'] = "Award Program"
-                elif "Prize" in grant['title']:
-                    grant['organization'] = "Prize Program"
-                elif "Scholarship" in grant['title']:
-                    grant['organization'] = "Scholarship Program"
-                elif "Fellowship" in grant['title']:
-                    grant['organization'] = "Fellowship Program"
+                for keyword, org_name in _TITLE_ORG_KEYWORDS.items():
+                    if keyword in grant['title']:
+                        if org_name is None:
+                            foundation_match = _FOUNDATION_RE.search(grant['title'])
+                            org_name = foundation_match.group(1) if foundation_match else "Foundation Grant"
+                        grant['organization'] = org_name
+                        break
                 else:
                     # Use domain as last resort
                     url_parts = grant['applicationUrl'].split('/')
@@ -0,0 +1,20 @@
+"""Shared grants.json writer for the scraper and update_organizations.py"""
+import contextlib
+import os
+
+import orjson
+
+
+def save_grants(path, grants):
+    """Writes grants to path as an indented JSON array via a temp file and os.replace"""
+    # The swap is atomic, so an interrupted run never leaves a truncated grants.json behind
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(grants, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a stale temp file behind when serialising or writing fails
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
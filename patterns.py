@@ -0,0 +1,51 @@
+"""Precompiled patterns and text helpers shared by the scraper and update_organizations.py"""
+import re
+
+# Curly quotes, en/em dashes and NBSP -> ASCII equivalents, in one str.translate pass
+UNICODE_TABLE = str.maketrans({
+    '\u2019': "'", '\u2018': "'", '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '-', '\u00a0': ' '
+})
+
+# Organization extraction
+TITLE_ORG_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r"(?:by|from|at|for)\s+([A-Z][A-Za-z\s&'-]+?(?=\s+(Grant|Award|Program|Prize|Fellowship)))",
+    r"(?:by|from|at|for)\s+([A-Z][A-Za-z\s&'-]+?(?=\.|$))",
+    r"(?:presented by|sponsored by|supported by)\s+([A-Z][A-Za-z\s&'-]+)"
+)]
+DESC_ORG_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r"(?:The|A|An)\s+([A-Z][A-Za-z\s&'-]+?(?=\s+(is|has|announces|offers)))",
+    r"([A-Z][A-Za-z\s&'-]+?(?=\s+(Grant|Award|Program|Initiative)))",
+    r"(?:funded by|sponsored by)\s+([A-Z][A-Za-z\s&'-]+)"
+)]
+WWW_PREFIX_RE = re.compile(r'^www\.')
+TLD_SUFFIX_RE = re.compile(r'\.(com|org|net|gov|edu|co|ac|uk)$')
+COMMON_TLDS = frozenset({'com','org','net','gov','edu','co','ac','uk','www'})
+
+# Organization name cleanup
+URL_PREFIX_RE = re.compile(r"(https?://|www\.)", re.IGNORECASE)
+ORG_SUFFIX_RE = re.compile(r"\b(Trust|Foundation|Fund|Org(a?nization)?|Programme?)\b", re.IGNORECASE)
+
+
+def clean_text(text):
+    """Clean and normalize text content"""
+    if not text:
+        return text
+
+    # Replace common Unicode characters (pure-ASCII text has none, so skip the pass)
+    if not text.isascii():
+        text = text.translate(UNICODE_TABLE)
+
+    # Remove excessive whitespace (split/join collapses and strips in one pass)
+    return ' '.join(text.split())
+
+
+def find_org(patterns, text):
+    """First organization name captured by one of patterns in text, or None"""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            org = next((g for g in match.groups() if g), None)
+            if org:
+                return clean_text(org.strip("'s").strip())
+    return None
@@ -1,4 +1,4 @@
-import json
+import orjson
 import os
 from pymongo import MongoClient
 import logging
@@ -22,8 +22,8 @@ def populate_local_mongodb():
             return False
 
         # Read local grants.json
-        with open('grants.json', 'r', encoding='utf-8') as f:
-            grants = json.load(f)
+        with open('grants.json', 'rb') as f:
+            grants = orjson.loads(f.read())
 
         if not grants:
             logging.warning("No grants found in grants.json")
@@ -38,8 +38,8 @@ def populate_local_mongodb():
         collection.delete_many({})
         logging.info("Cleared existing collection")
 
-        # Insert all grants
-        result = collection.insert_many(grants)
+        # Insert all grants; unordered so the server does not have to apply them one by one in sequence
+        result = collection.insert_many(grants, ordered=False)
         logging.info(f"Successfully inserted {len(result.inserted_ids)} grants into MongoDB")
 
         # Create index on applicationUrl for faster lookups
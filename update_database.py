@@ -1,5 +1,6 @@
-import json
+import orjson
 import pymongo
+from pymongo import UpdateOne
 import logging
 import os
 import sys
@@ -40,33 +41,32 @@ def update_mongodb():
         logging.info(f"Using collection: {DB_NAME}.{COLLECTION_NAME}")
         
         # Load the latest grants data
-        with open('grants.json', 'r', encoding='utf-8') as f:
-            grants = json.load(f)
+        with open('grants.json', 'rb') as f:
+            grants = orjson.loads(f.read())
         
         logging.info(f"Loaded {len(grants)} grants from grants.json")
         
-        # Track new grants
-        existing_titles = set(doc['title'] for doc in collection.find({}, {'title': 1}))
-        new_grants = []
-        updated_grants = 0
+        # Title lookups for the upserts below are served by this index
+        collection.create_index('title')
         
-        # Process each grant
+        # Queue one upsert per grant and send them to the server in a single batch
+        operations = []
         for grant in grants:
             # Add a timestamp for when this was added to the database
             grant['last_updated'] = datetime.now().isoformat()
-            
-            # Check if this is a new grant
-            if grant['title'] not in existing_titles:
-                new_grants.append(grant)
-                collection.insert_one(grant)
-            else:
-                # Update existing grant
-                result = collection.update_one(
-                    {'title': grant['title']},
-                    {'$set': grant}
-                )
-                if result.modified_count > 0:
-                    updated_grants += 1
+            operations.append(UpdateOne(
+                {'title': grant['title']},
+                {'$set': grant},
+                upsert=True
+            ))
+        
+        new_grants = []
+        updated_grants = 0
+        if operations:
+            result = collection.bulk_write(operations, ordered=False)
+            # upserted_ids is keyed by operation index, which matches the grants list
+            new_grants = [grants[index] for index in sorted(result.upserted_ids)]
+            updated_grants = result.modified_count
         
         logging.info(f"Added {len(new_grants)} new grants to MongoDB")
         logging.info(f"Updated {updated_grants} existing grants in MongoDB")
@@ -1,8 +1,9 @@
-import json
-import re
+import orjson
 import logging
-from bs4 import BeautifulSoup
-import requests
+from urllib.parse import urlparse, urlsplit
+from grants_io import save_grants
+from patterns import (COMMON_TLDS, DESC_ORG_PATTERNS, ORG_SUFFIX_RE, TITLE_ORG_PATTERNS, TLD_SUFFIX_RE,
+                      URL_PREFIX_RE, WWW_PREFIX_RE, clean_text, find_org)
 
 # Configure logging
 logging.basicConfig(
@@ -13,49 +14,20 @@ logging.basicConfig(
     ]
 )
 
-def clean_text(text):
-    """Clean and normalize text content"""
-    if not text:
-        return text
-        
-    # Replace common Unicode characters
-    text = text.replace('\u2019', "'")
-    text = text.replace('\u2018', "'")
-    text = text.replace('\u201c', '"')
-    text = text.replace('\u201d', '"')
-    text = text.replace('\u2013', '-')
-    text = text.replace('\u2014', '-')
-    text = text.replace('\u00a0', ' ')
-    
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    return text
-
 def extract_organization(article, grant):
     """Enhanced organization name extraction from multiple sources"""
     # Priority 1: Check if organization is mentioned in title pattern
     title = grant.get('title', '')
-    org_patterns = [
-        r"(?:by|from|at|for)\s+([A-Z][A-Za-z\s&'-]+?(?=\s+(Grant|Award|Program|Prize|Fellowship)))",
-        r"(?:by|from|at|for)\s+([A-Z][A-Za-z\s&'-]+?(?=\.|$))",
-        r"(?:presented by|sponsored by|supported by)\s+([A-Z][A-Za-z\s&'-]+)"
-    ]
-    
-    for pattern in org_patterns:
-        match = re.search(pattern, title, re.IGNORECASE)
-        if match:
-            org = next((g for g in match.groups() if g), None)
-            if org:
-                return clean_text(org.strip("'s").strip())
+    org = find_org(TITLE_ORG_PATTERNS, title)
+    if org:
+        return org
     
     # Priority 2: Extract from URL domain
     url = grant.get('applicationUrl', '')
     if url:
         try:
-            domain = url.split('/')[2] if len(url.split('/')) > 2 else ''
-            domain_parts = [p for p in domain.split('.') 
-                          if p.lower() not in {'com','org','net','gov','edu','co','ac','uk','www'}]
+            domain = urlsplit(url).hostname or ''
+            domain_parts = [p for p in domain.split('.') if p not in COMMON_TLDS]
             if domain_parts:
                 org = max(domain_parts, key=len)
                 return clean_text(org.replace('-', ' ').title())
@@ -66,27 +38,18 @@ def extract_organization(article, grant):
     desc = grant.get('description', '')
     if desc:
         first_sentence = desc.split('.')[0] if '.' in desc else desc
-        org_patterns = [
-            r"(?:The|A|An)\s+([A-Z][A-Za-z\s&'-]+?(?=\s+(is|has|announces|offers)))",
-            r"([A-Z][A-Za-z\s&'-]+?(?=\s+(Grant|Award|Program|Initiative)))",
-            r"(?:funded by|sponsored by)\s+([A-Z][A-Za-z\s&'-]+)"
-        ]
-        for pattern in org_patterns:
-            match = re.search(pattern, first_sentence, re.IGNORECASE)
-            if match:
-                org = next((g for g in match.groups() if g), None)
-                if org:
-                    return clean_text(org.strip("'s").strip())
+        org = find_org(DESC_ORG_PATTERNS, first_sentence)
+        if org:
+            return org
     
     # Priority 5: Extract from application URL directly
     if url:
         try:
-            from urllib.parse import urlparse
             hostname = urlparse(url).netloc
             if hostname:
                 # Remove www. and common TLDs
-                org_name = re.sub(r'^www\.', '', hostname)
-                org_name = re.sub(r'\.(com|org|net|gov|edu|co|ac|uk)$', '', org_name)
+                org_name = WWW_PREFIX_RE.sub('', hostname)
+                org_name = TLD_SUFFIX_RE.sub('', org_name)
                 if org_name:
                     return clean_text(org_name.split('.')[0].replace('-', ' ').title())
         except Exception as e:
@@ -98,8 +61,8 @@ def extract_organization(article, grant):
 def update_grants_organizations():
     # Load existing grants
     try:
-        with open('c:\\Users\\doug\\Documents\\Cline\\grant_scraper\\grants.json', 'r', encoding='utf-8') as f:
-            grants = json.load(f)
+        with open('c:\\Users\\doug\\Documents\\Cline\\grant_scraper\\grants.json', 'rb') as f:
+            grants = orjson.loads(f.read())
         logging.info(f"Loaded {len(grants)} grants from file")
     except Exception as e:
         logging.error(f"Error loading grants: {e}")
@@ -115,8 +78,8 @@ def update_grants_organizations():
             
             if new_org and new_org != "Unknown Organization":
                 # Clean organization name
-                new_org = re.sub(r"(https?://|www\.)", "", new_org, flags=re.IGNORECASE)
-                new_org = re.sub(r"\b(Trust|Foundation|Fund|Org(a?nization)?|Programme?)\b", "", new_org, flags=re.IGNORECASE)
+                new_org = URL_PREFIX_RE.sub("", new_org)
+                new_org = ORG_SUFFIX_RE.sub("", new_org)
                 new_org = new_org.strip(" -_./")
                 
                 if len(new_org) >= 3:  # Only use if not too short after cleaning
@@ -127,8 +90,7 @@ def update_grants_organizations():
     # Save updated grants
     if updated_count > 0:
         try:
-            with open('c:\\Users\\doug\\Documents\\Cline\\grant_scraper\\grants.json', 'w', encoding='utf-8') as f:
-                json.dump(grants, f, indent=2, ensure_ascii=False)
+            save_grants('c:\\Users\\doug\\Documents\\Cline\\grant_scraper\\grants.json', grants)
             logging.info(f"Successfully updated {updated_count} organizations and saved to grants.json")
         except Exception as e:
             logging.error(f"Error saving grants: {e}")